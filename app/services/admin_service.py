@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from app.core.config import AppConfig
 from app.services.backend_client import BackendAPIError, BackendClient
 
+_MAX_PASSWORD_LENGTH = 1024
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AdminUser:
     admin_id: int
     username: str
@@ -23,6 +25,8 @@ class AdminService:
     def authenticate(self, username: str, password: str) -> AdminUser | None:
         if not username.strip() or not password:
             return None
+        if len(password) > _MAX_PASSWORD_LENGTH:
+            return None
         try:
             payload = self._client.post(
                 "/api/v1/admins/authenticate",
@@ -49,6 +53,7 @@ class AdminService:
         admin_username: str | None = None,
     ) -> AdminUser:
         _ = admin_username
+        self._check_password_length(password)
         try:
             payload = self._client.post(
                 "/api/v1/admins",
@@ -70,6 +75,7 @@ class AdminService:
         admin_username: str | None = None,
     ) -> None:
         _ = admin_username
+        self._check_password_length(new_password)
         try:
             self._client.patch(
                 f"/api/v1/admins/{admin_id}/password",
@@ -111,6 +117,13 @@ class AdminService:
             return None
         return self._to_admin(payload)
 
+    @staticmethod
+    def _check_password_length(password: str) -> None:
+        if len(password) > _MAX_PASSWORD_LENGTH:
+            raise ValueError(
+                f"رمز عبور نباید بیشتر از {_MAX_PASSWORD_LENGTH} کاراکتر باشد."
+            )
+
     @staticmethod
     def _to_admin(raw: dict) -> AdminUser:
         return AdminUser(
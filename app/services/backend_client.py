@@ -98,6 +98,11 @@ class BackendClient:
     def _get_shared_session(
         cls, base_url: str
     ) -> tuple[requests.Session, threading.RLock]:
+        session = cls._session_pool.get(base_url)
+        if session is not None:
+            # Locks are published before sessions, so a visible session
+            # always has its lock registered.
+            return session, cls._session_locks[base_url]
         with cls._pool_guard:
             session = cls._session_pool.get(base_url)
             session_lock = cls._session_locks.get(base_url)
@@ -111,9 +116,10 @@ class BackendClient:
                 session.mount("http://", adapter)
                 session.mount("https://", adapter)
                 session.headers.update({"Accept": "application/json"})
-                session_lock = threading.RLock()
-                cls._session_pool[base_url] = session
-                cls._session_locks[base_url] = session_lock
+                session_lock = cls._session_locks.setdefault(
+                    base_url, threading.RLock()
+                )
+                session = cls._session_pool.setdefault(base_url, session)
             return session, session_lock
 
     @classmethod
@@ -4,9 +4,20 @@ import logging
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=0,
+    ),
+)
+
 
 def list_vendor_orders(
     vendor_id: str,
@@ -42,6 +53,6 @@ def list_vendor_orders(
         limit,
         offset,
     )
-    response = requests.get(url, params=params, headers=headers, timeout=30)
+    response = _session.get(url, params=params, headers=headers, timeout=30)
     response.raise_for_status()
     return response.json()
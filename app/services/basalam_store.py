@@ -1,29 +1,47 @@
 from __future__ import annotations
 
+import threading
+import time
+
 from app.core.config import AppConfig
 from app.services.backend_client import BackendAPIError, BackendClient
 
 
 class BasalamIdStore:
+    # Order IDs known to exist are answered locally for a short while,
+    # per backend URL. They expire rather than live for the session because
+    # `import_legacy --replace` truncates basalam_order_ids.
+    _KNOWN_IDS_TTL = 60.0
+    _KNOWN_IDS_LIMIT = 10000
+    _known_ids: dict[str, dict[str, float]] = {}
+    _known_lock = threading.Lock()
+
     def __init__(self, db_path=None) -> None:
         _ = db_path
         config = AppConfig.load()
+        self._backend_url = config.backend_url
         self._client = BackendClient(config.backend_url)
 
     def fetch_existing_ids(self, ids: list[str]) -> set[str]:
         if not ids:
             return set()
+        known = self._lookup(ids)
+        pending = [item for item in ids if item not in known]
+        if not pending:
+            return known
         try:
             payload = self._client.post(
                 "/api/v1/basalam/order-ids/check",
-                json_body={"ids": ids},
+                json_body={"ids": pending},
             )
         except BackendAPIError:
-            return set()
+            return known
         existing = (
             payload.get("existing_ids", []) if isinstance(payload, dict) else []
         )
-        return {str(item) for item in existing}
+        found = {str(item) for item in existing}
+        self._remember(found)
+        return known | found
 
     def store_ids(self, ids: list[str]) -> None:
         if not ids:
@@ -35,3 +53,36 @@ class BasalamIdStore:
             )
         except BackendAPIError:
             return
+        self._remember(ids)
+
+    def _lookup(self, ids: list[str]) -> set[str]:
+        now = time.monotonic()
+        known: set[str] = set()
+        with self._known_lock:
+            entries = self._known_ids.get(self._backend_url)
+            if not entries:
+                return known
+            for item in ids:
+                expiry = entries.get(item)
+                if expiry is None:
+                    continue
+                if expiry <= now:
+                    del entries[item]
+                else:
+                    known.add(item)
+        return known
+
+    def _remember(self, ids: set[str] | list[str]) -> None:
+        now = time.monotonic()
+        expiry = now + self._KNOWN_IDS_TTL
+        with self._known_lock:
+            entries = self._known_ids.setdefault(self._backend_url, {})
+            if len(entries) >= self._KNOWN_IDS_LIMIT:
+                for item in [
+                    key for key, value in entries.items() if value <= now
+                ]:
+                    del entries[item]
+                if len(entries) >= self._KNOWN_IDS_LIMIT:
+                    entries.clear()
+            for item in ids:
+                entries[item] = expiry
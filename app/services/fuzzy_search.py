@@ -1,54 +1,106 @@
 from __future__ import annotations
 
+import threading
+
 from rapidfuzz import process
 
 from app.utils.text import normalize_text
 
+_INDEX_CACHE_SIZE = 4
+_MIN_FUZZY_QUERY_LENGTH = 3
+_index_cache: list[FuzzyIndex] = []
+_index_lock = threading.Lock()
+
+
+class FuzzyIndex:
+    def __init__(
+        self, choices: list[str], normalized: list[str] | None = None
+    ) -> None:
+        self.choices = list(choices)
+        if normalized is not None and len(normalized) == len(self.choices):
+            self._normalized = list(normalized)
+        else:
+            self._normalized = [
+                normalize_text(choice) for choice in self.choices
+            ]
+
+    def query(self, query: str, limit: int = 20) -> list[str]:
+        if not query or len(query.strip()) < 1:
+            return []
+
+        normalized_query = normalize_text(query)
+        if not normalized_query:
+            return []
+
+        exact: list[str] = []
+        starts: list[str] = []
+        contains: list[str] = []
+        remaining: list[str] = []
+        remaining_normalized: list[str] = []
+        # One or two characters are only meaningful as substrings; scoring
+        # the rest of the corpus against them just adds noise.
+        collect_remaining = len(normalized_query) >= _MIN_FUZZY_QUERY_LENGTH
+
+        for choice, normalized_choice in zip(self.choices, self._normalized):
+            if not normalized_choice:
+                continue
+            if normalized_choice == normalized_query:
+                exact.append(choice)
+            elif normalized_choice.startswith(normalized_query):
+                starts.append(choice)
+            elif normalized_query in normalized_choice:
+                contains.append(choice)
+            elif collect_remaining:
+                remaining.append(choice)
+                remaining_normalized.append(normalized_choice)
+
+        ordered = exact + starts + contains
+        seen = set(ordered)
+
+        fuzzy_matches: list[str] = []
+        # Direct hits already fill the completer; a fuzzy tail after them
+        # would only be scrolled past.
+        if remaining and len(ordered) < limit:
+            matches = process.extract(
+                normalized_query,
+                remaining_normalized,
+                limit=limit,
+                score_cutoff=30,
+                processor=None,
+            )
+            for _, _, position in matches:
+                candidate = remaining[position]
+                if candidate not in seen:
+                    fuzzy_matches.append(candidate)
+                    seen.add(candidate)
+
+        return ordered + fuzzy_matches
+
 
 def get_fuzzy_matches(
-    query: str, choices: list[str], limit: int = 20
+    query: str,
+    choices: list[str],
+    limit: int = 20,
+    pre_normalized: list[str] | None = None,
 ) -> list[str]:
     if not query or len(query.strip()) < 1 or not choices:
         return []
+    return _get_index(choices, pre_normalized).query(query, limit=limit)
 
-    normalized_query = normalize_text(query)
-    if not normalized_query:
-        return []
 
-    exact: list[str] = []
-    starts: list[str] = []
-    contains: list[str] = []
-    remaining: list[str] = []
-
-    for choice in choices:
-        normalized_choice = normalize_text(choice)
-        if not normalized_choice:
-            continue
-        if normalized_choice == normalized_query:
-            exact.append(choice)
-        elif normalized_choice.startswith(normalized_query):
-            starts.append(choice)
-        elif normalized_query in normalized_choice:
-            contains.append(choice)
-        else:
-            remaining.append(choice)
-
-    ordered = exact + starts + contains
-    seen = set(ordered)
-
-    fuzzy_matches: list[str] = []
-    if remaining:
-        matches = process.extract(
-            query,
-            remaining,
-            limit=limit,
-            score_cutoff=30,
-            processor=normalize_text,
-        )
-        for match in matches:
-            candidate = match[0]
-            if candidate not in seen:
-                fuzzy_matches.append(candidate)
-                seen.add(candidate)
-
-    return ordered + fuzzy_matches
+def _get_index(
+    choices: list[str], pre_normalized: list[str] | None = None
+) -> FuzzyIndex:
+    # Completers search the same product list on every keystroke, so keep
+    # the last few normalized corpora around instead of re-normalizing.
+    with _index_lock:
+        for position, index in enumerate(_index_cache):
+            if index.choices == choices:
+                if position:
+                    _index_cache.insert(0, _index_cache.pop(position))
+                return index
+    index = FuzzyIndex(choices, pre_normalized)
+    with _index_lock:
+        _index_cache.insert(0, index)
+        del _index_cache[_INDEX_CACHE_SIZE:]
+    return index
@@ -4,7 +4,9 @@ from dataclasses import dataclass, field
 import logging
 import math
 from pathlib import Path
+import time
 
+import numpy as np
 import pandas as pd
 
 from app.core.config import AppConfig
@@ -37,16 +39,22 @@ class InventoryService:
         "alarm",
         "source",
     ]
+    # Settings pages and the main window re-read these on every refresh;
+    # a short TTL collapses bursts without hiding changes for long.
+    _SETTINGS_CACHE_TTL = 5.0
 
     def __init__(self, store: InventoryStore, config: AppConfig) -> None:
         self.store = store
         self.config = config
         self._name_index: dict[str, int] = {}
+        self._normalized_names: list[str] = []
+        self._product_names: list[str] = []
         self._logger = logging.getLogger(self.__class__.__name__)
         self._client = BackendClient(config.backend_url)
         self._loaded = False
         self._sell_price_alarm_percent = 20.0
         self._sales_import_fuzzy_match_percent = 85.0
+        self._settings_expiry: dict[str, float] = {}
 
     def set_inventory_path(self, path: str | Path | None) -> None:
         self.store.set_path(path)
@@ -101,6 +109,8 @@ class InventoryService:
         return payload if isinstance(payload, dict) else {}
 
     def fetch_sell_price_alarm_percent(self) -> float:
+        if self._settings_fresh("sell_price_alarm"):
+            return self._sell_price_alarm_percent
         try:
             payload = self._client.get("/api/v1/settings/sell-price-alarm")
         except BackendAPIError as exc:
@@ -112,6 +122,7 @@ class InventoryService:
         if percent < 0:
             percent = 0.0
         self._sell_price_alarm_percent = percent
+        self._mark_settings_fresh("sell_price_alarm")
         return self._sell_price_alarm_percent
 
     def update_sell_price_alarm_percent(self, percent: float) -> float:
@@ -132,12 +143,15 @@ class InventoryService:
         if value < 0:
             value = 0.0
         self._sell_price_alarm_percent = value
+        self._mark_settings_fresh("sell_price_alarm")
         return self._sell_price_alarm_percent
 
     def get_cached_sell_price_alarm_percent(self) -> float:
         return float(self._sell_price_alarm_percent)
 
     def fetch_sales_import_fuzzy_match_percent(self) -> float:
+        if self._settings_fresh("sales_import_fuzzy_match"):
+            return self._sales_import_fuzzy_match_percent
         try:
             payload = self._client.get(
                 "/api/v1/settings/sales-import-fuzzy-match"
@@ -153,6 +167,7 @@ class InventoryService:
         elif percent > 100:
             percent = 100.0
         self._sales_import_fuzzy_match_percent = percent
+        self._mark_settings_fresh("sales_import_fuzzy_match")
         return self._sales_import_fuzzy_match_percent
 
     def update_sales_import_fuzzy_match_percent(self, percent: float) -> float:
@@ -173,11 +188,20 @@ class InventoryService:
         value = self._to_finite_float(percent_raw, default=safe_percent)
         value = max(0.0, min(100.0, value))
         self._sales_import_fuzzy_match_percent = value
+        self._mark_settings_fresh("sales_import_fuzzy_match")
         return self._sales_import_fuzzy_match_percent
 
     def get_cached_sales_import_fuzzy_match_percent(self) -> float:
         return float(self._sales_import_fuzzy_match_percent)
 
+    def _settings_fresh(self, key: str) -> bool:
+        return time.monotonic() < self._settings_expiry.get(key, 0.0)
+
+    def _mark_settings_fresh(self, key: str) -> None:
+        self._settings_expiry[key] = (
+            time.monotonic() + self._SETTINGS_CACHE_TTL
+        )
+
     def list_product_groups(self) -> list[ProductGroup]:
         try:
             payload = self._client.get("/api/v1/product-groups")
@@ -258,34 +282,39 @@ class InventoryService:
                     break
                 offset += len(batch)
 
-            rows = []
-            for item in items:
-                rows.append(
-                    {
-                        "product_name": str(
-                            item.get("product_name", "")
-                        ).strip(),
-                        "quantity": self._to_finite_int(
-                            item.get("quantity", 0), default=0
-                        ),
-                        "avg_buy_price": self._to_finite_float(
-                            item.get("avg_buy_price", 0.0), default=0.0
-                        ),
-                        "last_buy_price": self._to_finite_float(
-                            item.get("last_buy_price", 0.0), default=0.0
+            count = len(items)
+            df = pd.DataFrame(
+                {
+                    "product_name": [
+                        str(item.get("product_name", "")).strip()
+                        for item in items
+                    ],
+                    "quantity": np.fromiter(
+                        (
+                            self._to_finite_int(
+                                item.get("quantity", 0), default=0
+                            )
+                            for item in items
                         ),
-                        "sell_price": self._to_finite_float(
-                            item.get("sell_price", 0.0), default=0.0
-                        ),
-                        "alarm": item.get("alarm"),
-                        "source": (
-                            None
-                            if is_empty_marker(item.get("source"))
-                            else str(item.get("source")).strip()
-                        ),
-                    }
-                )
-            df = pd.DataFrame(rows)
+                        dtype=np.int64,
+                        count=count,
+                    ),
+                    "avg_buy_price": self._float_column(
+                        items, "avg_buy_price"
+                    ),
+                    "last_buy_price": self._float_column(
+                        items, "last_buy_price"
+                    ),
+                    "sell_price": self._float_column(items, "sell_price"),
+                    "alarm": [item.get("alarm") for item in items],
+                    "source": [
+                        None
+                        if is_empty_marker(item.get("source"))
+                        else str(item.get("source")).strip()
+                        for item in items
+                    ],
+                }
+            )
             if df.empty:
                 df = pd.DataFrame(
                     columns=[
@@ -349,120 +378,146 @@ class InventoryService:
             raise InventoryFileError(str(exc)) from exc
         return None
 
+    def _float_column(
+        self, items: list[dict[str, object]], key: str
+    ) -> np.ndarray:
+        return np.fromiter(
+            (
+                self._to_finite_float(item.get(key, 0.0), default=0.0)
+                for item in items
+            ),
+            dtype=np.float64,
+            count=len(items),
+        )
+
     def _coerce_inventory_rows(
         self, df: pd.DataFrame | None
     ) -> list[dict[str, object]]:
-        if df is None:
+        if df is None or "product_name" not in df.columns:
             return []
-        df_to_save = df.copy()
-        if "product_name" not in df_to_save.columns:
-            return []
-        if "quantity" not in df_to_save.columns:
-            df_to_save["quantity"] = 0
-        if "avg_buy_price" not in df_to_save.columns:
-            df_to_save["avg_buy_price"] = 0.0
-        if "last_buy_price" not in df_to_save.columns:
-            df_to_save["last_buy_price"] = 0.0
-        if "sell_price" not in df_to_save.columns:
-            df_to_save["sell_price"] = 0.0
-        if "alarm" not in df_to_save.columns:
-            df_to_save["alarm"] = None
-        if "source" not in df_to_save.columns:
-            df_to_save["source"] = None
-        working = df_to_save[self._INVENTORY_COLUMNS].copy()
-        working["product_name"] = (
-            working["product_name"].fillna("").astype(str).str.strip()
-        )
-        working = working[working["product_name"] != ""].copy()
-        if working.empty:
+        names = df["product_name"].fillna("").astype(str).str.strip()
+        keep = names != ""
+        if not keep.any():
             return []
+        # reindex fills absent columns with NaN, which the sanitizers below
+        # turn into the same defaults the explicit column fills used to.
+        working = df.loc[keep].reindex(columns=self._INVENTORY_COLUMNS)
 
-        working["quantity"] = self._sanitize_numeric_series(
-            working["quantity"], default=0
-        ).astype(int)
-        working["avg_buy_price"] = self._sanitize_numeric_series(
-            working["avg_buy_price"], default=0.0
-        ).astype(float)
-        working["last_buy_price"] = self._sanitize_numeric_series(
-            working["last_buy_price"], default=0.0
-        ).astype(float)
-        working["sell_price"] = self._sanitize_numeric_series(
-            working["sell_price"], default=0.0
-        ).astype(float)
         alarm_numeric = self._sanitize_numeric_series(
             working["alarm"], default=pd.NA
         )
-        working["alarm"] = [
-            int(value) if pd.notna(value) else None
-            for value in alarm_numeric.tolist()
-        ]
-        working["source"] = [
-            None if is_empty_marker(value) else str(value).strip()
-            for value in working["source"].tolist()
+        alarm_present = alarm_numeric.notna().to_numpy(dtype=bool)
+        alarm = np.full(len(working), None, dtype=object)
+        alarm[alarm_present] = (
+            alarm_numeric[alarm_present].astype(float).astype("int64").tolist()
+        )
+        source = working["source"]
+        source_present = ~source.map(is_empty_marker).to_numpy(dtype=bool)
+        source_text = np.full(len(working), None, dtype=object)
+        source_text[source_present] = (
+            source[source_present].astype(str).str.strip().tolist()
+        )
+
+        columns = (
+            names[keep].tolist(),
+            self._sanitize_numeric_series(working["quantity"], default=0)
+            .astype(int)
+            .tolist(),
+            self._sanitize_numeric_series(
+                working["avg_buy_price"], default=0.0
+            )
+            .astype(float)
+            .tolist(),
+            self._sanitize_numeric_series(
+                working["last_buy_price"], default=0.0
+            )
+            .astype(float)
+            .tolist(),
+            self._sanitize_numeric_series(working["sell_price"], default=0.0)
+            .astype(float)
+            .tolist(),
+            alarm.tolist(),
+            source_text.tolist(),
+        )
+        return [
+            dict(zip(self._INVENTORY_COLUMNS, values))
+            for values in zip(*columns)
         ]
-        return working.to_dict(orient="records")
 
     def _compute_inventory_delta(
         self,
         old_rows: list[dict[str, object]],
         new_rows: list[dict[str, object]],
     ) -> tuple[list[dict[str, object]], list[str]]:
-        old_map = {
-            self._normalize_name(str(row.get("product_name", ""))): row
-            for row in old_rows
-            if str(row.get("product_name", "")).strip()
-        }
-        new_map = {
-            self._normalize_name(str(row.get("product_name", ""))): row
-            for row in new_rows
-            if str(row.get("product_name", "")).strip()
-        }
-        upserts: list[dict[str, object]] = []
-        for key, new_row in new_map.items():
-            old_row = old_map.get(key)
-            if old_row is None or self._inventory_row_changed(old_row, new_row):
-                upserts.append(new_row)
-        deletes = [
-            str(old_map[key].get("product_name", "")).strip()
-            for key in old_map
-            if key not in new_map
+        # Both sides come out of _coerce_inventory_rows, so names are already
+        # stripped, alarm/source use None for missing values and the numeric
+        # columns are plain ints/floats that can be compared column-wise.
+        # Saves rarely rename products, so most names appear on both sides;
+        # normalize each distinct name once.
+        keys: dict[str, str] = {}
+        old_df = self._keyed_inventory_frame(old_rows, keys)
+        new_df = self._keyed_inventory_frame(new_rows, keys)
+        merged = new_df.merge(
+            old_df.drop(columns="_position"),
+            on="_key",
+            how="left",
+            suffixes=("_new", "_old"),
+            indicator=True,
+        )
+
+        def column(name: str, side: str) -> pd.Series:
+            return merged[f"{name}_{side}"]
+
+        changed = merged["_merge"].eq("left_only")
+        changed |= column("product_name", "new").ne(
+            column("product_name", "old")
+        )
+        changed |= column("quantity", "new").ne(column("quantity", "old"))
+        changed |= (
+            pd.to_numeric(column("alarm", "new").fillna(0))
+            .ne(pd.to_numeric(column("alarm", "old").fillna(0)))
+        )
+        for name in ("avg_buy_price", "last_buy_price", "sell_price"):
+            difference = (column(name, "new") - column(name, "old")).abs()
+            changed |= difference.gt(1e-6)
+        changed |= (
+            column("source", "new")
+            .fillna("")
+            .ne(column("source", "old").fillna(""))
+        )
+
+        upserts = [
+            new_rows[position]
+            for position in merged.loc[changed, "_position"].tolist()
         ]
+        deletes = old_df.loc[
+            ~old_df["_key"].isin(new_df["_key"]), "product_name"
+        ].tolist()
         return upserts, deletes
 
-    @staticmethod
-    def _inventory_row_changed(
-        old_row: dict[str, object], new_row: dict[str, object]
-    ) -> bool:
-        if (
-            str(old_row.get("product_name", "")).strip()
-            != str(new_row.get("product_name", "")).strip()
-        ):
-            return True
-        int_fields = ("quantity", "alarm")
-        float_fields = ("avg_buy_price", "last_buy_price", "sell_price")
-        text_fields = ("source",)
-        for field in int_fields:
-            old_value = old_row.get(field)
-            new_value = new_row.get(field)
-            if old_value is None and new_value is None:
-                continue
-            if int(old_value or 0) != int(new_value or 0):
-                return True
-        for field in float_fields:
-            old_value = float(old_row.get(field, 0) or 0)
-            new_value = float(new_row.get(field, 0) or 0)
-            if abs(old_value - new_value) > 1e-6:
-                return True
-        for field in text_fields:
-            old_value = old_row.get(field)
-            new_value = new_row.get(field)
-            if (
-                None if is_empty_marker(old_value) else str(old_value).strip()
-            ) != (
-                None if is_empty_marker(new_value) else str(new_value).strip()
-            ):
-                return True
-        return False
+    def _keyed_inventory_frame(
+        self, rows: list[dict[str, object]], keys: dict[str, str]
+    ) -> pd.DataFrame:
+        frame = pd.DataFrame(rows, columns=self._INVENTORY_COLUMNS)
+        frame["_position"] = frame.index
+        frame["product_name"] = (
+            frame["product_name"].fillna("").astype(str).str.strip()
+        )
+        frame = frame[frame["product_name"] != ""]
+        names = frame["product_name"].tolist()
+        normalize = self._normalize_name
+        for name in set(names).difference(keys):
+            keys[name] = normalize(name)
+        frame["_key"] = [keys[name] for name in names]
+        # Duplicate names resolve to the last row but keep the position of
+        # the first one, matching how the rows used to be collected in a dict.
+        first_keys = frame["_key"].drop_duplicates()
+        frame = (
+            frame.drop_duplicates("_key", keep="last")
+            .set_index("_key")
+            .loc[first_keys]
+        )
+        return frame.reset_index()
 
     def _rows_to_dataframe(self, rows: list[dict[str, object]]) -> pd.DataFrame:
         if not rows:
@@ -480,10 +535,12 @@ class InventoryService:
     def get_product_names(self) -> list[str]:
         if not self.is_loaded():
             return []
-        df = self.store.dataframe
-        if df is None or "product_name" not in df.columns:
+        return self._product_names
+
+    def get_normalized_product_names(self) -> list[str]:
+        if not self.is_loaded():
             return []
-        return df["product_name"].astype(str).str.strip().tolist()
+        return self._normalized_names
 
     def find_index(self, product_name: str) -> int | None:
         key = self._normalize_name(product_name)
@@ -519,11 +576,19 @@ class InventoryService:
     def _rebuild_index(self, df: pd.DataFrame) -> None:
         if "product_name" not in df.columns:
             self._name_index = {}
+            self._normalized_names = []
+            self._product_names = []
             return
-        self._name_index = {
-            self._normalize_name(name): idx
-            for idx, name in df["product_name"].items()
-        }
+        # Completers ask for the names on every keystroke; build the list
+        # once per load/save instead of on each call.
+        self._product_names = (
+            df["product_name"].astype(str).str.strip().tolist()
+        )
+        normalize = self._normalize_name
+        self._normalized_names = [
+            normalize(name) for name in df["product_name"].tolist()
+        ]
+        self._name_index = dict(zip(self._normalized_names, df.index))
 
     @staticmethod
     def _normalize_name(name: str) -> str:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 from rapidfuzz import fuzz, process
 
@@ -33,6 +34,7 @@ class SalesPreviewSummary:
 
 class SalesImportService:
     DEFAULT_FUZZY_MATCH_PERCENT = 85.0
+    _FUZZY_BATCH_SIZE = 64
     REQUIRED_COLUMNS = ["product_name", "quantity_sold"]
     COLUMN_ALIASES = {
         "product name": "product_name",
@@ -328,29 +330,41 @@ class SalesImportService:
         if not normalized_choices:
             return
 
+        pending: list[tuple[SalesPreviewRow, str]] = []
         for row in preview_rows:
             if str(row.status).strip().lower() != "error":
                 continue
             if str(row.message).strip() != "Product not found":
                 continue
             query = normalize_text(row.product_name)
-            if not query:
-                continue
-            match = process.extractOne(
-                query,
+            if query:
+                pending.append((row, query))
+        if not pending:
+            return
+
+        # Score unmatched rows in blocks so the query x inventory matrix
+        # stays bounded while rapidfuzz spreads each block over all cores.
+        matches: list[tuple[SalesPreviewRow, float, int]] = []
+        for start in range(0, len(pending), cls._FUZZY_BATCH_SIZE):
+            block = pending[start : start + cls._FUZZY_BATCH_SIZE]
+            scores = process.cdist(
+                [query for _, query in block],
                 normalized_choices,
                 scorer=fuzz.WRatio,
                 score_cutoff=threshold,
+                dtype=np.float64,
+                workers=-1,
             )
-            if not match:
-                continue
-            _matched, score, index = match
-            if (
-                not isinstance(index, int)
-                or index < 0
-                or index >= len(candidates)
+            best_indexes = scores.argmax(axis=1)
+            for (row, _query), row_scores, index in zip(
+                block, scores, best_indexes
             ):
-                continue
+                score = float(row_scores[index])
+                if score < threshold:
+                    continue
+                matches.append((row, score, int(index)))
+
+        for row, score, index in matches:
             candidate = candidates[index]
             matched_name = str(candidate.get("product_name", "")).strip()
             if not matched_name:
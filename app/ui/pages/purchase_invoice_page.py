@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from typing import Callable
 
-from PySide6.QtCore import QEvent, QLocale, Qt, Signal
+from PySide6.QtCore import QEvent, QLocale, QStringListModel, Qt, Signal
 from PySide6.QtGui import QValidator
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QAbstractSpinBox,
+    QCompleter,
     QFrame,
     QHBoxLayout,
     QHeaderView,
@@ -319,9 +320,6 @@ class PurchaseInvoicePage(QWidget):
     def _update_completer(self, text: str, widget: QLineEdit) -> None:
         if not self.product_provider:
             return
-        from PySide6.QtCore import QStringListModel, Qt
-        from PySide6.QtWidgets import QCompleter
-
         matches = get_fuzzy_matches(text, self._get_cached_product_names())
         completer = widget.completer()
 
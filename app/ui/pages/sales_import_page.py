@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QEvent, QLocale, Qt, QTimer, Signal
+from PySide6.QtCore import (
+    QEvent,
+    QLocale,
+    QStringListModel,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QIntValidator
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -75,17 +82,10 @@ class ProductNameDelegate(QStyledItemDelegate):
             completer.popup().hide()
             return
         model = completer.model()
-        if model is None:
-            from PySide6.QtCore import QStringListModel
-
-            completer.setModel(QStringListModel(matches))
+        if isinstance(model, QStringListModel):
+            model.setStringList(matches)
         else:
-            from PySide6.QtCore import QStringListModel
-
-            if isinstance(model, QStringListModel):
-                model.setStringList(matches)
-            else:
-                completer.setModel(QStringListModel(matches))
+            completer.setModel(QStringListModel(matches))
         completer.complete()
 
 
@@ -547,11 +547,15 @@ class SettingsPage(QWidget):
             else None
         )
         admin_username = admin.username if admin else None
-        self.admin_service.update_password(
-            self.current_admin.admin_id,
-            new_password,
-            admin_username=admin_username,
-        )
+        try:
+            self.admin_service.update_password(
+                self.current_admin.admin_id,
+                new_password,
+                admin_username=admin_username,
+            )
+        except ValueError as exc:
+            dialogs.show_error(self, self.tr("رمز عبور"), str(exc))
+            return
         if self.action_log_service:
             self.action_log_service.log_action(
                 "password_change",
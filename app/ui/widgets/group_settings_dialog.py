@@ -396,7 +396,13 @@ class GroupSettingsDialog(QDialog):
 
     def _update_member_completer(self, text: str) -> None:
         product_names = self.inventory_service.get_product_names()
-        matches = get_fuzzy_matches(text, product_names)
+        matches = get_fuzzy_matches(
+            text,
+            product_names,
+            pre_normalized=(
+                self.inventory_service.get_normalized_product_names()
+            ),
+        )
         completer = self.add_member_input.completer()
 
         if not matches:
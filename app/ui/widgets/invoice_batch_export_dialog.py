@@ -433,9 +433,7 @@ class InvoiceBatchExportDialog(QDialog):
     def _set_picker_from_gregorian(
         picker: JalaliDatePicker, dt: datetime
     ) -> None:
-        jalali_text = to_jalali_datetime(
-            dt.isoformat(timespec="seconds")
-        ).split(" ")[0]
+        jalali_text = to_jalali_datetime(dt).split(" ")[0]
         try:
             jy, jm, jd = (int(part) for part in jalali_text.split("/"))
         except ValueError:
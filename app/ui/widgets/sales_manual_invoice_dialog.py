@@ -2,11 +2,19 @@ from __future__ import annotations
 
 from typing import Callable
 
-from PySide6.QtCore import QEvent, QLocale, QPoint, Qt, Signal
+from PySide6.QtCore import (
+    QEvent,
+    QLocale,
+    QPoint,
+    QStringListModel,
+    Qt,
+    Signal,
+)
 from PySide6.QtGui import QValidator
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QAbstractSpinBox,
+    QCompleter,
     QDialog,
     QFrame,
     QHBoxLayout,
@@ -274,9 +282,6 @@ class SalesManualInvoiceDialog(QDialog):
     def _update_completer(self, text: str, widget: QLineEdit) -> None:
         if not self.product_provider:
             return
-        from PySide6.QtCore import QStringListModel, Qt
-        from PySide6.QtWidgets import QCompleter
-
         matches = get_fuzzy_matches(text, self.product_provider())
         completer = widget.completer()
 
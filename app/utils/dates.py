@@ -103,11 +103,14 @@ def _jalali_to_gregorian(jy: int, jm: int, jd: int) -> tuple[int, int, int]:
     return gy, gm, gd
 
 
-def to_jalali_datetime(value: str) -> str:
-    try:
-        dt = datetime.fromisoformat(value)
-    except ValueError:
-        return value
+def to_jalali_datetime(value: str | datetime) -> str:
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return value
 
     if dt.tzinfo is not None:
         dt = dt.astimezone(ZoneInfo("Asia/Tehran"))
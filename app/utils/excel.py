@@ -334,9 +334,7 @@ def _populate_invoice_sheet(ws, invoice, lines) -> None:
     ws.row_dimensions[1].height = 30
 
     export_dt = datetime.now(ZoneInfo("Asia/Tehran"))
-    export_date = to_jalali_datetime(
-        export_dt.isoformat(timespec="seconds")
-    ).split(" ")[0]
+    export_date = to_jalali_datetime(export_dt).split(" ")[0]
     invoice_date = to_jalali_datetime(invoice.created_at).split(" ")[0]
     invoice_name = str(getattr(invoice, "invoice_name", "") or "").strip()
 
@@ -61,9 +61,7 @@ def _draw_invoice_pdf(
     invoice_type_text = _invoice_type_label(invoice)
 
     export_dt = datetime.now(ZoneInfo("Asia/Tehran"))
-    export_date = to_jalali_datetime(
-        export_dt.isoformat(timespec="seconds")
-    ).split(" ")[0]
+    export_date = to_jalali_datetime(export_dt).split(" ")[0]
     invoice_date = to_jalali_datetime(invoice.created_at).split(" ")[0]
     invoice_name = str(getattr(invoice, "invoice_name", "") or "").strip()
 
@@ -1,9 +1,5 @@
 from __future__ import annotations
 
-import re
-
-from app.utils.numeric import normalize_numeric_text
-
 _ARABIC_TO_PERSIAN = str.maketrans(
     {
         "ي": "ی",
@@ -32,17 +28,26 @@ _PUNCTUATION = {
     "\u200d": " ",
 }
 _EMPTY_MARKERS = {"nan", "none", "<na>", "nat", "null"}
+# Digit folding, separator handling, Arabic letter variants and punctuation
+# collapsed into one table so normalize_text is a single translate pass.
+# Thousands separators are dropped outright and the decimal mark ends up as
+# a space, as it did when normalize_numeric_text ran before the punctuation
+# replacements.
+_NORMALIZE_TABLE = {
+    **str.maketrans(_PUNCTUATION),
+    **_ARABIC_TO_PERSIAN,
+    **str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "0123456789" * 2),
+    ord("٬"): None,
+    ord(","): None,
+    ord("٫"): " ",
+}
 
 
 def normalize_text(value: str) -> str:
     if value is None:
         return ""
-    text = normalize_numeric_text(str(value))
-    text = text.translate(_ARABIC_TO_PERSIAN)
-    for key, replacement in _PUNCTUATION.items():
-        text = text.replace(key, replacement)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text.casefold()
+    text = str(value).translate(_NORMALIZE_TABLE)
+    return " ".join(text.split()).casefold()
 
 
 def is_empty_marker(value: object) -> bool:
@@ -2,6 +2,7 @@ package repository
 
 import (
 	"context"
+	"crypto/subtle"
 	"database/sql"
 	"encoding/json"
 	"errors"
@@ -624,7 +625,7 @@ func (r *Repository) AuthenticateAdmin(ctx context.Context, username, password s
 	if err != nil {
 		return nil, fmt.Errorf("authenticate admin query: %w", err)
 	}
-	if storedPassword != password {
+	if subtle.ConstantTimeCompare([]byte(storedPassword), []byte(password)) != 1 {
 		return nil, nil
 	}
 	return &domain.AdminUser{